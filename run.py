@@ -7,15 +7,25 @@ Main entry point for starting the Linux-Android integration system.
 import os
 import sys
 import argparse
+import importlib.util
 import subprocess
 import signal
-import time
 from pathlib import Path
 
 # Set up base paths
 PROJECT_ROOT = Path(__file__).parent.resolve()
 LINUX_SERVER_PATH = PROJECT_ROOT / "linux-server"
 
+# Packages the server needs at runtime
+REQUIRED_PACKAGES = (
+    "fastapi",
+    "uvicorn",
+    "websockets",
+    "cryptography",
+    "pyperclip",
+    "zeroconf",
+)
+
 def start_server(args):
     """
     Start the Linux server process with command line arguments.
@@ -60,25 +70,23 @@ def start_server(args):
 def check_dependencies():
     """
     Verify that all required Python packages are installed.
-    Attempts to import each dependency and reports any missing packages.
+    Looks up each dependency without importing it (the server process does
+    the real imports) and reports any missing packages.
     Returns True if all dependencies are met, False otherwise.
     """
-    try:
-        # Try to import required packages
-        import fastapi
-        import uvicorn
-        import websockets
-        import cryptography
-        import pyperclip
-        import zeroconf
-        
-        print("✅ All basic dependencies are installed.")
-        return True
-    except ImportError as e:
-        # If any import fails, inform the user about the missing dependency
-        print(f"❌ Missing dependency: {e}")
+    missing = [
+        name for name in REQUIRED_PACKAGES
+        if importlib.util.find_spec(name) is None
+    ]
+    
+    if missing:
+        # If any package is not installed, inform the user about it
+        print(f"❌ Missing dependency: {', '.join(missing)}")
         print("Please run: pip install -r requirements.txt")
         return False
+    
+    print("✅ All basic dependencies are installed.")
+    return True
 
 def install_systemd_service():
     """
@@ -147,9 +155,8 @@ def main():
     server_process = start_server(args)
     
     try:
-        # Keep the main process running while the server is active
-        while server_process.poll() is None:
-            time.sleep(1)
+        # Block until the server exits instead of polling it every second
+        server_process.wait()
     except KeyboardInterrupt:
         # Handle graceful shutdown when user presses Ctrl+C
         print("Shutting down...")
@@ -7,6 +7,7 @@ and file transfer capabilities between Linux and Android devices.
 """
 
 import os
+import re
 import sys
 import json
 import signal
@@ -16,6 +17,7 @@ import threading
 import subprocess
 import websocket
 import time
+from collections import OrderedDict, deque
 from pathlib import Path
 import gi
 
@@ -23,12 +25,29 @@ gi.require_version('Gtk', '3.0')
 gi.require_version('Notify', '0.7')
 from gi.repository import Gtk, GLib, Gdk, GdkPixbuf, Notify, Gio, Pango
 
+# Prefer orjson for the WebSocket hot path, fall back to the standard library
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# QR code rendering is optional
+try:
+    from qrcode import QRCode
+    _HAVE_QR = True
+except ImportError:
+    QRCode = None
+    _HAVE_QR = False
+
 # Set up paths
 APP_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = APP_DIR.parent.parent
 SERVER_DIR = PROJECT_ROOT / "linux-server"
 RESOURCES_DIR = APP_DIR.parent / "resources"
 
+# The hostname does not change while the app is running
+HOSTNAME = socket.gethostname()
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -36,6 +55,97 @@ logging.basicConfig(
 )
 logger = logging.getLogger("sic-ubuntu-app")
 
+
+def _loads(message):
+    """Decode a JSON message"""
+    if orjson is not None:
+        return orjson.loads(message)
+    return json.loads(message)
+
+
+def _dumps(data):
+    """Encode data as a JSON string"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data).decode()
+        except orjson.JSONEncodeError:
+            # e.g. surrogate-escaped file names, which the stdlib escapes
+            pass
+    return json.dumps(data)
+
+
+# Clipboard texts above this size are coalesced before being applied
+_LARGE_CLIPBOARD_TEXT = 64 * 1024
+
+# Maximum number of icon pixbufs kept by the main window
+_ICON_CACHE_SIZE = 128
+
+# Maximum number of detached transfer cards kept for reuse
+_CARD_POOL_SIZE = 16
+
+# Transfer statuses after which a transfer card is removed
+_TERMINAL_TRANSFER_STATUSES = ("completed", "failed", "canceled")
+
+# Patterns matched against raw server output lines
+_SERVER_ERROR_RE = re.compile(rb"error|exception", re.IGNORECASE)
+_PAIRING_LINE_RE = re.compile(rb"pairing ?code", re.IGNORECASE)
+_PAIRING_CODE_RE = re.compile(rb"[A-Z0-9]{6}")
+
+# Constant control messages are serialized once
+_MSG_PING = _dumps({"type": "ping"})
+_MSG_GET_STATUS = _dumps({"type": "admin_request", "action": "get_status"})
+_MSG_GET_DEVICES = _dumps({"type": "admin_request", "action": "get_devices"})
+
+# Application stylesheet, loaded once at startup
+_CSS_BYTES = b"""
+    .card {
+        border: 1px solid alpha(currentColor, 0.2);
+        border-radius: 6px;
+        padding: 15px;
+        background-color: alpha(currentColor, 0.05);
+    }
+    .card-header,
+    .transfer-card > label:nth-child(1) {
+        font-weight: bold;
+        font-size: 18px;
+        border-bottom: 1px solid alpha(currentColor, 0.1);
+        padding-bottom: 10px;
+        margin-bottom: 10px;
+    }
+    .code {
+        font-family: monospace;
+        background-color: alpha(currentColor, 0.07);
+        padding: 6px;
+        border-radius: 4px;
+    }
+    .info-label {
+        font-weight: bold;
+    }
+    .status-info {
+        color: #2196F3;
+    }
+    .status-success {
+        color: #4CAF50;
+    }
+    .status-warning {
+        color: #FF9800;
+    }
+    .status-error {
+        color: #F44336;
+    }
+    .device-row {
+        padding: 8px;
+        border-bottom: 1px solid alpha(currentColor, 0.1);
+    }
+    .transfer-card {
+        border: 1px solid alpha(currentColor, 0.1);
+        border-radius: 4px;
+        padding: 10px;
+        margin-bottom: 8px;
+    }
+"""
+
+
 class SICApplication(Gtk.Application):
     """Main application class for the SIC Ubuntu App"""
     
@@ -48,20 +158,57 @@ class SICApplication(Gtk.Application):
         self.connected = False
         self.device_id = None
         self.paired_devices = {}
+        self._online_devices_cache = None  # (device_id, name) pairs, rebuilt on change
         self.active_transfers = {}
-        self.settings = {
-            "clipboard_sync": True,
-            "notification_mirroring": True,
-            "auto_reconnect": True
-        }
+        # Settings are plain attributes so the message handlers read them cheaply
+        self.clipboard_sync = True
+        self.notification_mirroring = True
+        self.auto_reconnect = True
         self.reconnect_attempts = 0
         self.max_reconnect_attempts = 10
+        self._reconnect_pending = False
+        self._reconnect_lock = threading.Lock()
         self.heartbeat_timer = None
         self.current_pairing_code = None  # Store current pairing code to prevent changes
         
+        # UI updates queued by the WebSocket thread, applied in one main-loop tick
+        self._ui_events = deque()
+        self._ui_events_lock = threading.Lock()
+        self._ui_drain_scheduled = False
+        
+        # Clipboard state for deferred writes
+        self._clipboard_set = False
+        self._pending_clipboard_text = None
+        self._clipboard_flush_source = 0
+        
+        # WebSocket message handlers keyed by message type
+        self._handlers = {
+            "status_update": self._h_status_update,
+            "device_connected": self._h_device_connected,
+            "device_disconnected": self._h_device_disconnected,
+            "transfer_update": self._h_transfer_update,
+            "clipboard_sync": self._h_clipboard_sync,
+            "notification": self._h_notification,
+            "pong": self._h_pong,
+        }
+        
+        # Read the server's device ID once; it is retried later if missing
+        self.load_device_id()
+        
         # Initialize notification system
         Notify.init("SIC Ubuntu")
+        self._notifications = {}  # app_name -> reusable Notify.Notification
         
+    def load_device_id(self):
+        """Return the server's device ID, reading it from disk until it is known"""
+        if self.device_id is None:
+            try:
+                self.device_id = (SERVER_DIR / ".device_id").read_text().strip() or None
+            except OSError:
+                # The server creates the file on its first run
+                pass
+        return self.device_id
+    
     def do_activate(self):
         """Activate the application"""
         # We only allow a single window
@@ -84,6 +231,9 @@ class SICApplication(Gtk.Application):
         # Handle keyboard shortcuts
         self.setup_actions()
         
+        # Apply CSS styling
+        self.apply_css()
+        
     def setup_actions(self):
         """Set up application actions and keyboard shortcuts"""
         # Quit action (Ctrl+Q)
@@ -98,6 +248,17 @@ class SICApplication(Gtk.Application):
         self.add_action(refresh_action)
         self.set_accels_for_action("app.refresh", ["F5"])
     
+    def apply_css(self):
+        """Load the application stylesheet for the default screen"""
+        css_provider = Gtk.CssProvider()
+        css_provider.load_from_data(_CSS_BYTES)
+        
+        Gtk.StyleContext.add_provider_for_screen(
+            Gdk.Screen.get_default(),
+            css_provider,
+            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+        )
+    
     def start_server(self):
         """Start the backend server as a subprocess"""
         if self.server_process and self.server_process.poll() is None:
@@ -126,7 +287,7 @@ class SICApplication(Gtk.Application):
                 env=env,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                universal_newlines=True
+                bufsize=0  # Raw byte pipe; monitor_server_output reads and decodes it
             )
             
             # Start a thread to read server output
@@ -144,44 +305,67 @@ class SICApplication(Gtk.Application):
     
     def monitor_server_output(self, process):
         """Monitor and log server output"""
-        for line in iter(process.stdout.readline, ''):
-            line = line.strip()
-            if line:
-                if "ERROR" in line.upper() or "EXCEPTION" in line.upper():
-                    logger.error(f"Server: {line}")
-                else:
-                    logger.info(f"Server: {line}")
-                    
-                # Look for the pairing code in the output - make pattern more flexible
-                if "pairing code" in line.lower() or "pairingcode" in line.lower():
-                    try:
-                        # Extract pairing code (handle different formats)
-                        if ":" in line:
-                            pairing_code = line.split(":")[-1].strip()
-                        else:
-                            # Try to find the code as a 6-character alphanumeric string
-                            import re
-                            match = re.search(r"[A-Z0-9]{6}", line)
-                            if match:
-                                pairing_code = match.group(0)
-                            else:
-                                continue  # No valid code found in this line
-                                
-                        logger.info(f"Found pairing code: {pairing_code}")
-                        self.current_pairing_code = pairing_code  # Store pairing code
-                        GLib.idle_add(self.window.update_pairing_code, pairing_code)
-                    except Exception as e:
-                        logger.error(f"Error extracting pairing code: {e}")
+        fd = process.stdout.fileno()
+        buffer = bytearray()
+        
+        # Read whatever output is available and split it into lines ourselves
+        while True:
+            try:
+                chunk = os.read(fd, 65536)
+            except OSError:
+                break
+            if not chunk:
+                break
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for raw_line in lines:
+                self.handle_server_line(raw_line)
+        
+        if buffer:
+            self.handle_server_line(buffer)
         
         # Process has ended
         logger.warning("Server process has terminated")
         GLib.idle_add(self.window.update_status, "Server stopped", "warning")
         
         # Attempt to restart if needed
-        if self.settings["auto_reconnect"]:
+        if self.auto_reconnect:
             logger.info("Attempting to restart server...")
             GLib.idle_add(self.start_server)
     
+    def handle_server_line(self, raw_line):
+        """Log a line of server output and pick up the pairing code from it"""
+        raw_line = raw_line.strip()
+        if not raw_line:
+            return
+        
+        line = raw_line.decode("utf-8", "replace")
+        if _SERVER_ERROR_RE.search(raw_line):
+            logger.error(f"Server: {line}")
+        else:
+            logger.info(f"Server: {line}")
+        
+        # Look for the pairing code in the output - make pattern more flexible
+        if not _PAIRING_LINE_RE.search(raw_line):
+            return
+        
+        try:
+            # Extract pairing code (handle different formats)
+            if ":" in line:
+                pairing_code = line.split(":")[-1].strip()
+            else:
+                # Try to find the code as a 6-character alphanumeric string
+                match = _PAIRING_CODE_RE.search(raw_line)
+                if not match:
+                    return  # No valid code found in this line
+                pairing_code = match.group(0).decode("ascii")
+            
+            logger.info(f"Found pairing code: {pairing_code}")
+            self.current_pairing_code = pairing_code  # Store pairing code
+            GLib.idle_add(self.window.update_pairing_code, pairing_code)
+        except Exception as e:
+            logger.error(f"Error extracting pairing code: {e}")
+    
     def connect_to_server(self):
         """Connect to the WebSocket server"""
         threading.Thread(target=self._connect_ws, daemon=True).start()
@@ -229,7 +413,7 @@ class SICApplication(Gtk.Application):
             self.ws_client.run_forever(
                 ping_interval=15,       # Reduced from 30 seconds for more responsive detection
                 ping_timeout=5,         # Reduced from 10 seconds
-                reconnect=self.settings["auto_reconnect"],
+                reconnect=self.auto_reconnect,
                 skip_utf8_validation=True  # For better performance
             )
             
@@ -240,11 +424,29 @@ class SICApplication(Gtk.Application):
             GLib.idle_add(self.window.update_status, f"Connection error: {e}", "error")
             
             # Attempt to reconnect with exponential backoff
-            if self.settings["auto_reconnect"] and self.reconnect_attempts < self.max_reconnect_attempts:
-                delay = min(30, 2 ** self.reconnect_attempts)  # Exponential backoff with 30s max
-                logger.info(f"Reconnecting in {delay}s (attempt {self.reconnect_attempts + 1}/{self.max_reconnect_attempts})")
-                self.reconnect_attempts += 1
-                threading.Timer(delay, self.connect_to_server).start()
+            if self.auto_reconnect and self.reconnect_attempts < self.max_reconnect_attempts:
+                self.schedule_reconnect()
+    
+    def schedule_reconnect(self):
+        """Schedule a reconnection attempt with exponential backoff"""
+        with self._reconnect_lock:
+            # Only one reconnect may be pending at a time
+            if self._reconnect_pending:
+                return
+            self._reconnect_pending = True
+            delay = min(30, 2 ** self.reconnect_attempts)  # Exponential backoff with 30s max
+            logger.info(f"Reconnecting in {delay}s (attempt {self.reconnect_attempts + 1}/{self.max_reconnect_attempts})")
+            self.reconnect_attempts += 1
+        
+        # A GLib timeout on the main loop instead of a new timer thread per attempt
+        GLib.timeout_add_seconds(delay, self._reconnect)
+    
+    def _reconnect(self):
+        """Run a scheduled reconnection attempt"""
+        with self._reconnect_lock:
+            self._reconnect_pending = False
+        self.connect_to_server()
+        return False
     
     def on_ws_open(self, ws):
         """WebSocket connection opened"""
@@ -259,17 +461,14 @@ class SICApplication(Gtk.Application):
         GLib.idle_add(self.window.update_status, "Connected", "success")
         
         # Request initial status
-        ws.send(json.dumps({
-            "type": "admin_request",
-            "action": "get_status"
-        }))
+        ws.send(_MSG_GET_STATUS)
     
     def start_heartbeat(self, ws):
         """Start WebSocket heartbeat"""
         def send_ping():
             if self.connected and self.ws_client:
                 try:
-                    ws.send(json.dumps({"type": "ping"}))
+                    ws.send(_MSG_PING)
                     logger.debug("Sent heartbeat ping")
                     # Schedule next heartbeat
                     self.heartbeat_timer = threading.Timer(30.0, send_ping)
@@ -294,54 +493,98 @@ class SICApplication(Gtk.Application):
     def on_ws_message(self, ws, message):
         """WebSocket message received"""
         try:
-            data = json.loads(message)
-            logger.debug(f"Received: {data}")
-            
-            # Handle different message types
-            if data.get("type") == "status_update":
-                GLib.idle_add(self.window.update_devices, data.get("devices", []))
-                GLib.idle_add(self.window.update_transfers, data.get("transfers", {}))
-            
-            elif data.get("type") == "device_connected":
-                GLib.idle_add(self.window.update_status, "Device connected", "success")
-                # Request updated device list
-                ws.send(json.dumps({
-                    "type": "admin_request",
-                    "action": "get_devices"
-                }))
-            
-            elif data.get("type") == "device_disconnected":
-                GLib.idle_add(self.window.update_status, "Device disconnected", "warning")
-                # Request updated device list
-                ws.send(json.dumps({
-                    "type": "admin_request",
-                    "action": "get_devices"
-                }))
+            data = _loads(message)
+            # Avoid formatting the whole payload when debug logging is off
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Received: {data}")
             
-            elif data.get("type") == "transfer_update":
-                GLib.idle_add(self.window.update_transfer, data.get("transfer", {}))
-            
-            elif data.get("type") == "clipboard_sync":
-                if self.settings["clipboard_sync"]:
-                    text = data.get("text", "")
-                    if text:
-                        # Set clipboard text
-                        GLib.idle_add(self.set_clipboard_text, text)
-            
-            elif data.get("type") == "notification":
-                if self.settings["notification_mirroring"]:
-                    # Display notification
-                    app_name = data.get("app_name", "Android")
-                    summary = data.get("summary", "Notification")
-                    body = data.get("body", "")
-                    GLib.idle_add(self.show_notification, app_name, summary, body)
-            
-            elif data.get("type") == "pong":
-                logger.debug("Received heartbeat pong")
+            # Dispatch to the handler for this message type
+            handler = self._handlers.get(data.get("type"))
+            if handler:
+                handler(ws, data)
         
         except Exception as e:
             logger.error(f"Error processing message: {e}")
     
+    def _h_status_update(self, ws, data):
+        """Handle a status update with the device and transfer lists"""
+        self.queue_ui_event(self.update_paired_devices, data.get("devices", []))
+        self.queue_ui_event(self.window.update_devices, data.get("devices", []))
+        self.queue_ui_event(self.window.update_transfers, data.get("transfers", {}))
+    
+    def _h_device_connected(self, ws, data):
+        """Handle a device connecting to the server"""
+        self.queue_ui_event(self.window.update_status, "Device connected", "success")
+        # Request updated device list
+        ws.send(_MSG_GET_DEVICES)
+    
+    def _h_device_disconnected(self, ws, data):
+        """Handle a device disconnecting from the server"""
+        self.queue_ui_event(self.window.update_status, "Device disconnected", "warning")
+        # Request updated device list
+        ws.send(_MSG_GET_DEVICES)
+    
+    def _h_transfer_update(self, ws, data):
+        """Handle progress or status change of a single transfer"""
+        self.queue_ui_event(self.window.update_transfer, data.get("transfer", {}))
+    
+    def _h_clipboard_sync(self, ws, data):
+        """Handle clipboard text received from a device"""
+        if self.clipboard_sync:
+            text = data.get("text", "")
+            if text:
+                # Set clipboard text
+                self.queue_ui_event(self.set_clipboard_text, text)
+    
+    def _h_notification(self, ws, data):
+        """Handle a notification mirrored from a device"""
+        if self.notification_mirroring:
+            # Display notification
+            app_name = data.get("app_name", "Android")
+            summary = data.get("summary", "Notification")
+            body = data.get("body", "")
+            self.queue_ui_event(self.show_notification, app_name, summary, body)
+    
+    def _h_pong(self, ws, data):
+        """Handle a heartbeat reply"""
+        logger.debug("Received heartbeat pong")
+    
+    def queue_ui_event(self, callback, *args):
+        """Queue a UI update from a worker thread for the GTK main loop"""
+        with self._ui_events_lock:
+            self._ui_events.append((callback, args))
+            if self._ui_drain_scheduled:
+                return
+            self._ui_drain_scheduled = True
+        
+        # Only one idle callback is pending at a time, however many events arrive
+        GLib.idle_add(self._drain_ui_events)
+    
+    def _drain_ui_events(self):
+        """Apply all queued UI updates in a single main-loop tick"""
+        with self._ui_events_lock:
+            events = list(self._ui_events)
+            self._ui_events.clear()
+            self._ui_drain_scheduled = False
+        
+        # Status and device list updates overwrite each other, so only the
+        # last one of each in this batch needs to be applied
+        collapsible = (self.window.update_status, self.window.update_devices)
+        last_index = {}
+        for index, (callback, args) in enumerate(events):
+            if callback in collapsible:
+                last_index[callback] = index
+        
+        for index, (callback, args) in enumerate(events):
+            if callback in last_index and last_index[callback] != index:
+                continue
+            try:
+                callback(*args)
+            except Exception as e:
+                logger.error(f"Error applying UI update: {e}")
+        
+        return False
+    
     def on_ws_error(self, ws, error):
         """WebSocket error handler"""
         logger.error(f"WebSocket error: {error}")
@@ -357,41 +600,85 @@ class SICApplication(Gtk.Application):
         GLib.idle_add(self.window.update_status, "Disconnected", "warning")
         
         # Attempt to reconnect if auto-reconnect is enabled
-        if self.settings["auto_reconnect"] and self.reconnect_attempts < self.max_reconnect_attempts:
-            delay = min(30, 2 ** self.reconnect_attempts)  # Exponential backoff with 30s max
-            logger.info(f"Reconnecting in {delay}s (attempt {self.reconnect_attempts + 1}/{self.max_reconnect_attempts})")
-            self.reconnect_attempts += 1
-            threading.Timer(delay, self.connect_to_server).start()
+        if self.auto_reconnect and self.reconnect_attempts < self.max_reconnect_attempts:
+            self.schedule_reconnect()
         elif self.reconnect_attempts >= self.max_reconnect_attempts:
             logger.error(f"Max reconnection attempts ({self.max_reconnect_attempts}) reached")
             GLib.idle_add(self.window.update_status, "Connection failed - restart app", "error")
     
     def send_message(self, message):
-        """Send a message to the WebSocket server"""
+        """Send a message (dict or pre-serialized string) to the WebSocket server"""
         if not self.connected or not self.ws_client:
             logger.warning("Cannot send message, not connected")
             return False
             
         try:
-            self.ws_client.send(json.dumps(message))
+            if not isinstance(message, str):
+                message = _dumps(message)
+            self.ws_client.send(message)
             return True
         except Exception as e:
             logger.error(f"Error sending message: {e}")
             return False
     
+    def send_admin_request(self, action, **params):
+        """Send an admin request with the given action and parameters"""
+        params["type"] = "admin_request"
+        params["action"] = action
+        return self.send_message(params)
+    
+    def update_paired_devices(self, devices):
+        """Replace the known paired devices and drop the cached online list"""
+        self.paired_devices = {device.get("id"): device for device in devices}
+        self._online_devices_cache = None
+    
+    def get_online_devices(self):
+        """Return (device_id, name) pairs for the paired devices that are online"""
+        if self._online_devices_cache is None:
+            self._online_devices_cache = [
+                (device_id, device.get("name", "Unknown"))
+                for device_id, device in self.paired_devices.items()
+                if device.get("online", False)
+            ]
+        return self._online_devices_cache
+    
     def set_clipboard_text(self, text):
         """Set the clipboard text"""
+        if len(text) > _LARGE_CLIPBOARD_TEXT:
+            # Only the latest of a burst of large pastes needs to be applied
+            self._pending_clipboard_text = text
+            if not self._clipboard_flush_source:
+                self._clipboard_flush_source = GLib.timeout_add(100, self._flush_clipboard_text)
+            return
+        
+        # A newer small text supersedes any large one still waiting
+        self._pending_clipboard_text = None
+        self._apply_clipboard_text(text)
+    
+    def _flush_clipboard_text(self):
+        """Apply the pending large clipboard text"""
+        self._clipboard_flush_source = 0
+        text = self._pending_clipboard_text
+        self._pending_clipboard_text = None
+        if text is not None:
+            self._apply_clipboard_text(text)
+        return False
+    
+    def _apply_clipboard_text(self, text):
+        """Hand text to the clipboard (persisted with store() on shutdown)"""
         clipboard = Gtk.Clipboard.get(Gdk.SELECTION_CLIPBOARD)
         clipboard.set_text(text, -1)
-        clipboard.store()
+        self._clipboard_set = True
     
     def show_notification(self, app_name, summary, body):
         """Show a system notification"""
-        notification = Notify.Notification.new(
-            summary,
-            body,
-            "dialog-information"
-        )
+        # Reuse one notification per source app instead of creating a new one each time
+        notification = self._notifications.get(app_name)
+        if notification is None:
+            notification = Notify.Notification.new(summary, body, "dialog-information")
+            self._notifications[app_name] = notification
+        else:
+            notification.update(summary, body, "dialog-information")
         notification.show()
     
     def on_quit(self, action, param):
@@ -401,10 +688,7 @@ class SICApplication(Gtk.Application):
     def on_refresh(self, action, param):
         """Handle refresh action"""
         if self.connected:
-            self.send_message({
-                "type": "admin_request",
-                "action": "get_status"
-            })
+            self.send_message(_MSG_GET_STATUS)
             self.window.update_status("Refreshing...", "info")
     
     def do_shutdown(self):
@@ -428,6 +712,13 @@ class SICApplication(Gtk.Application):
         # Stop heartbeat timer
         self.stop_heartbeat()
         
+        # Let the clipboard manager keep the last synced text after exit
+        if self._clipboard_flush_source:
+            GLib.source_remove(self._clipboard_flush_source)
+            self._flush_clipboard_text()
+        if self._clipboard_set:
+            Gtk.Clipboard.get(Gdk.SELECTION_CLIPBOARD).store()
+        
         # Clean up notifications
         Notify.uninit()
         
@@ -446,6 +737,29 @@ class SICMainWindow(Gtk.ApplicationWindow):
         )
         
         self.app = application
+        self._transfer_cards = {}  # transfer_id -> card widget
+        self._card_pool = []  # detached cards ready for reuse
+        self._pending_removals = set()  # finished transfer_ids awaiting removal
+        self._removal_source = 0  # GLib source id of the pending removal flush
+        self._pending_transfer_updates = {}  # transfer_id -> latest queued transfer
+        self._flush_source = 0  # GLib source id of the pending flush
+        self._transfer_state = {}  # transfer_id -> latest known transfer
+        self._transfers_dirty = set()  # transfer_ids not yet drawn while hidden
+        self._device_rows = {}  # device_id -> (row, status_icon, label)
+        self._last_devices = {}  # device_id -> device dict last shown
+        self._qr_key = None  # (device_id, code) currently displayed
+        self._qr_pixbuf = None  # rendered QR pixbuf for _qr_key, once ready
+        self._file_chooser = None  # reused send-file chooser
+        self._device_dialog = None  # reused device selection dialog
+        self._device_combo = None  # device list inside the selection dialog
+        self._device_store = None  # (device_id, name) rows behind the combo
+        self._unpair_dialog = None  # reused unpair confirmation
+        self._icon_cache = OrderedDict()  # (icon_name, size, scale) -> pixbuf, least recent first
+        self._icon_theme_watched = False  # theme "changed" handler connected
+        self._pending_devices = None  # devices received before the Devices page was built
+        self._placeholder_shown = True  # "No active transfers" shown instead of cards
+        self.devices_list = None
+        self.transfers_box = None
         self.setup_ui()
     
     def setup_ui(self):
@@ -473,18 +787,28 @@ class SICMainWindow(Gtk.ApplicationWindow):
         self.notebook = Gtk.Notebook()
         self.add(self.notebook)
         
-        # Create tabs
+        # Create tabs; only the first page is built now, the rest when first shown
         self.create_pairing_tab()
-        self.create_devices_tab()
-        self.create_transfers_tab()
-        self.create_settings_tab()
-        
-        # Apply CSS styling
-        self.apply_css()
+        self.add_lazy_page("Devices", self.create_devices_tab)
+        self.add_lazy_page("Transfers", self.create_transfers_tab)
+        self.add_lazy_page("Settings", self.create_settings_tab)
         
         # Show all widgets
         self.show_all()
     
+    def add_lazy_page(self, title, populate):
+        """Add an empty notebook page that is filled in the first time it is shown"""
+        page = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
+        page.set_border_width(20)
+        page.map_handler = page.connect("map", self._on_lazy_page_map, populate)
+        self.notebook.append_page(page, Gtk.Label(label=title))
+    
+    def _on_lazy_page_map(self, page, populate):
+        """Build a lazy page's widgets on its first map"""
+        page.disconnect(page.map_handler)
+        populate(page)
+        page.show_all()
+    
     def create_pairing_tab(self):
         """Create the pairing tab"""
         # Main container for the tab
@@ -532,11 +856,7 @@ class SICMainWindow(Gtk.ApplicationWindow):
         card.pack_start(code_box, False, False, 0)
         
         # Device info
-        device_id_file = SERVER_DIR / ".device_id"
-        device_id = "Unknown"
-        if device_id_file.exists():
-            with open(device_id_file, "r") as f:
-                device_id = f.read().strip()
+        device_id = self.app.load_device_id() or "Unknown"
         
         info_box = Gtk.Grid()
         info_box.set_column_spacing(10)
@@ -559,7 +879,7 @@ class SICMainWindow(Gtk.ApplicationWindow):
         hostname_label.get_style_context().add_class("info-label")
         info_box.attach(hostname_label, 0, 1, 1, 1)
         
-        hostname_value = Gtk.Label(label=socket.gethostname())
+        hostname_value = Gtk.Label(label=HOSTNAME)
         hostname_value.set_halign(Gtk.Align.START)
         info_box.attach(hostname_value, 1, 1, 1, 1)
         
@@ -569,12 +889,8 @@ class SICMainWindow(Gtk.ApplicationWindow):
         pairing_label = Gtk.Label(label="Pairing")
         self.notebook.append_page(pairing_box, pairing_label)
     
-    def create_devices_tab(self):
-        """Create the devices tab"""
-        # Main container for the tab
-        devices_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
-        devices_box.set_border_width(20)
-        
+    def create_devices_tab(self, devices_box):
+        """Fill in the devices tab"""
         # Create card-like container
         card = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
         card.get_style_context().add_class("card")
@@ -595,24 +911,22 @@ class SICMainWindow(Gtk.ApplicationWindow):
         self.devices_list = Gtk.ListBox()
         self.devices_list.set_selection_mode(Gtk.SelectionMode.NONE)
         
-        # Add a placeholder message
+        # Placeholder message, shown by the list box whenever it is empty
         placeholder = Gtk.Label(label="No devices connected")
         placeholder.set_padding(10, 10)
-        self.devices_list.add(placeholder)
+        placeholder.show()
+        self.devices_list.set_placeholder(placeholder)
         
         scrolled.add(self.devices_list)
         card.pack_start(scrolled, True, True, 0)
         
-        # Add to notebook
-        devices_label = Gtk.Label(label="Devices")
-        self.notebook.append_page(devices_box, devices_label)
+        # Show devices that arrived before the page was built
+        if self._pending_devices is not None:
+            devices, self._pending_devices = self._pending_devices, None
+            self.update_devices(devices)
     
-    def create_transfers_tab(self):
-        """Create the file transfers tab"""
-        # Main container for the tab
-        transfers_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
-        transfers_box.set_border_width(20)
-        
+    def create_transfers_tab(self, transfers_box):
+        """Fill in the file transfers tab"""
         # Create card-like container
         card = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
         card.get_style_context().add_class("card")
@@ -640,25 +954,21 @@ class SICMainWindow(Gtk.ApplicationWindow):
         
         # Box for active transfers
         self.transfers_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
+        self.transfers_box.connect("map", self._replay_transfer_updates)
         
-        # Add a placeholder message
-        placeholder = Gtk.Label(label="No active transfers")
-        placeholder.set_padding(10, 10)
-        self.transfers_box.pack_start(placeholder, False, False, 0)
+        # Add a placeholder message, kept around to re-add when the list empties
+        self._no_transfers_placeholder = Gtk.Label(label="No active transfers")
+        self._no_transfers_placeholder.set_padding(10, 10)
+        self.transfers_box.pack_start(self._no_transfers_placeholder, False, False, 0)
+        
+        # Cards live in an inner box that is swapped with the placeholder
+        self._cards_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
         
         scrolled.add(self.transfers_box)
         card.pack_start(scrolled, True, True, 0)
-        
-        # Add to notebook
-        transfers_label = Gtk.Label(label="Transfers")
-        self.notebook.append_page(transfers_box, transfers_label)
     
-    def create_settings_tab(self):
-        """Create the settings tab"""
-        # Main container for the tab
-        settings_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
-        settings_box.set_border_width(20)
-        
+    def create_settings_tab(self, settings_box):
+        """Fill in the settings tab"""
         # Create card-like container
         card = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
         card.get_style_context().add_class("card")
@@ -681,8 +991,8 @@ class SICMainWindow(Gtk.ApplicationWindow):
         grid.attach(clipboard_label, 0, 0, 1, 1)
         
         clipboard_switch = Gtk.Switch()
-        clipboard_switch.set_active(self.app.settings["clipboard_sync"])
-        clipboard_switch.connect("notify::active", self.on_clipboard_switch_toggled)
+        clipboard_switch.set_active(self.app.clipboard_sync)
+        clipboard_switch.connect("notify::active", self._on_setting_switch_toggled, "clipboard_sync")
         clipboard_switch.set_halign(Gtk.Align.END)
         grid.attach(clipboard_switch, 1, 0, 1, 1)
         
@@ -692,8 +1002,8 @@ class SICMainWindow(Gtk.ApplicationWindow):
         grid.attach(notification_label, 0, 1, 1, 1)
         
         notification_switch = Gtk.Switch()
-        notification_switch.set_active(self.app.settings["notification_mirroring"])
-        notification_switch.connect("notify::active", self.on_notification_switch_toggled)
+        notification_switch.set_active(self.app.notification_mirroring)
+        notification_switch.connect("notify::active", self._on_setting_switch_toggled, "notification_mirroring")
         notification_switch.set_halign(Gtk.Align.END)
         grid.attach(notification_switch, 1, 1, 1, 1)
         
@@ -703,73 +1013,12 @@ class SICMainWindow(Gtk.ApplicationWindow):
         grid.attach(reconnect_label, 0, 2, 1, 1)
         
         reconnect_switch = Gtk.Switch()
-        reconnect_switch.set_active(self.app.settings["auto_reconnect"])
-        reconnect_switch.connect("notify::active", self.on_reconnect_switch_toggled)
+        reconnect_switch.set_active(self.app.auto_reconnect)
+        reconnect_switch.connect("notify::active", self._on_setting_switch_toggled, "auto_reconnect")
         reconnect_switch.set_halign(Gtk.Align.END)
         grid.attach(reconnect_switch, 1, 2, 1, 1)
         
         card.pack_start(grid, False, False, 10)
-        
-        # Add to notebook
-        settings_label = Gtk.Label(label="Settings")
-        self.notebook.append_page(settings_box, settings_label)
-    
-    def apply_css(self):
-        """Apply CSS styling to the window"""
-        css_provider = Gtk.CssProvider()
-        css = """
-            .card {
-                border: 1px solid alpha(currentColor, 0.2);
-                border-radius: 6px;
-                padding: 15px;
-                background-color: alpha(currentColor, 0.05);
-            }
-            .card-header {
-                font-weight: bold;
-                font-size: 18px;
-                border-bottom: 1px solid alpha(currentColor, 0.1);
-                padding-bottom: 10px;
-                margin-bottom: 10px;
-            }
-            .code {
-                font-family: monospace;
-                background-color: alpha(currentColor, 0.07);
-                padding: 6px;
-                border-radius: 4px;
-            }
-            .info-label {
-                font-weight: bold;
-            }
-            .status-info {
-                color: #2196F3;
-            }
-            .status-success {
-                color: #4CAF50;
-            }
-            .status-warning {
-                color: #FF9800;
-            }
-            .status-error {
-                color: #F44336;
-            }
-            .device-row {
-                padding: 8px;
-                border-bottom: 1px solid alpha(currentColor, 0.1);
-            }
-            .transfer-card {
-                border: 1px solid alpha(currentColor, 0.1);
-                border-radius: 4px;
-                padding: 10px;
-                margin-bottom: 8px;
-            }
-        """
-        css_provider.load_from_data(css.encode())
-        
-        Gtk.StyleContext.add_provider_for_screen(
-            Gdk.Screen.get_default(),
-            css_provider,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
     
     def update_status(self, message, status_type="info"):
         """Update the status message"""
@@ -787,213 +1036,403 @@ class SICMainWindow(Gtk.ApplicationWindow):
         """Update the pairing code display"""
         self.pairing_code_label.set_text(code)
         
-        # Generate a QR code if possible
+        device_id = self.app.load_device_id() or "unknown"
+        
+        if not _HAVE_QR:
+            logger.warning("qrcode package not installed, QR code not displayed")
+            self.qr_image.set_from_icon_name("image-missing", Gtk.IconSize.DIALOG)
+            return
+        
+        # Reuse the QR code if this pairing code is already rendered or rendering
+        key = (device_id, code)
+        if key == self._qr_key:
+            if self._qr_pixbuf:
+                self.qr_image.set_from_pixbuf(self._qr_pixbuf)
+            return
+        
+        # Only the current code's pixbuf is kept
+        self._qr_key = key
+        self._qr_pixbuf = None
+        
+        # Rendering is CPU-bound, so keep it off the GTK main thread
+        threading.Thread(target=self._render_qr_code, args=(key,), daemon=True).start()
+    
+    def _render_qr_code(self, key):
+        """Render the pairing QR code as RGB pixel data (runs in a worker thread)"""
+        device_id, code = key
         try:
-            from qrcode import QRCode
-            import io
-            from PIL import Image
-            
             # Generate QR code
-            device_id_file = SERVER_DIR / ".device_id"
-            device_id = "unknown"
-            if device_id_file.exists():
-                with open(device_id_file, "r") as f:
-                    device_id = f.read().strip()
-            
-            qr = QRCode(version=1, box_size=10, border=4)
+            qr = QRCode(version=1, border=4)
             qr.add_data(f"sic://{device_id}/{code}")
             qr.make(fit=True)
             
-            # Create PIL image
-            img = qr.make_image(fill_color="black", back_color="white")
-            
-            # Convert PIL image to GdkPixbuf
-            data = io.BytesIO()
-            img.save(data, format='PNG')
-            data.seek(0)
-            loader = GdkPixbuf.PixbufLoader.new_with_type('png')
-            loader.write(data.read())
-            loader.close()
-            
-            pixbuf = loader.get_pixbuf()
+            # One RGB pixel per module; scaled up when the pixbuf is built
+            matrix = qr.get_matrix()
+            pixels = b"".join(
+                b"\x00\x00\x00" if dark else b"\xff\xff\xff"
+                for row in matrix
+                for dark in row
+            )
+        except Exception as e:
+            logger.error(f"Error generating QR code: {e}")
+            return
+        
+        GLib.idle_add(self._show_qr_code, key, pixels, len(matrix))
+    
+    def _show_qr_code(self, key, pixels, size):
+        """Build a pixbuf from rendered QR pixel data and display it"""
+        pixbuf = GdkPixbuf.Pixbuf.new_from_bytes(
+            GLib.Bytes.new(pixels),
+            GdkPixbuf.Colorspace.RGB,
+            False,  # No alpha channel
+            8,
+            size,
+            size,
+            size * 3
+        )
+        # 10 pixels per module, matching the previous box size
+        pixbuf = pixbuf.scale_simple(size * 10, size * 10, GdkPixbuf.InterpType.NEAREST)
+        
+        # Skip if the pairing code changed while this one was rendering
+        if key == self._qr_key:
+            self._qr_pixbuf = pixbuf
             self.qr_image.set_from_pixbuf(pixbuf)
-            
-        except ImportError:
-            logger.warning("qrcode or Pillow package not installed, QR code not displayed")
-            self.qr_image.set_from_icon_name("image-missing", Gtk.IconSize.DIALOG)
+        return False
     
     def update_devices(self, devices):
         """Update the devices list"""
-        # Clear existing items
-        for child in self.devices_list.get_children():
-            self.devices_list.remove(child)
-        
-        # Add devices or placeholder
-        if not devices:
-            placeholder = Gtk.Label(label="No devices connected")
-            placeholder.set_padding(10, 10)
-            self.devices_list.add(placeholder)
+        # Keep only the latest list until the Devices page is built
+        if self.devices_list is None:
+            self._pending_devices = devices
+            return
+        
+        devices_by_id = {device.get("id"): device for device in devices}
+        
+        # Nothing to do if the list is unchanged since the last update
+        if devices_by_id == self._last_devices:
+            return
+        
+        # Remove rows for devices that are no longer listed
+        for device_id in list(self._device_rows):
+            if device_id not in devices_by_id:
+                device_row, _, _ = self._device_rows.pop(device_id)
+                device_row.destroy()
+        
+        # Update changed rows in place and add rows for new devices
+        for device_id, device in devices_by_id.items():
+            entry = self._device_rows.get(device_id)
+            if entry is None:
+                entry = self.create_device_row(device_id)
+                self._device_rows[device_id] = entry
+                self.set_device_row_state(entry, device)
+                entry[0].show_all()
+            elif device != self._last_devices.get(device_id):
+                self.set_device_row_state(entry, device)
+        
+        self._last_devices = devices_by_id
+    
+    def _get_icon(self, icon_name, size=16):
+        """Return a themed icon pixbuf for images that need one, from a small LRU cache"""
+        scale = self.get_scale_factor()
+        key = (icon_name, size, scale)
+        pixbuf = self._icon_cache.get(key)
+        if pixbuf is not None:
+            self._icon_cache.move_to_end(key)
+            return pixbuf
+        
+        # Watch for theme changes only once icons are actually cached
+        icon_theme = Gtk.IconTheme.get_default()
+        if not self._icon_theme_watched:
+            icon_theme.connect("changed", self._on_icon_theme_changed)
+            self._icon_theme_watched = True
+        
+        try:
+            pixbuf = icon_theme.load_icon_for_scale(icon_name, size, scale, 0)
+        except GLib.Error as e:
+            logger.debug(f"Could not load icon {icon_name}: {e}")
+            return None
+        
+        self._icon_cache[key] = pixbuf
+        if len(self._icon_cache) > _ICON_CACHE_SIZE:
+            self._icon_cache.popitem(last=False)
+        return pixbuf
+    
+    def _on_icon_theme_changed(self, icon_theme):
+        """Drop cached icons rendered from the previous theme"""
+        self._icon_cache.clear()
+    
+    def create_device_row(self, device_id):
+        """Create an empty row for a device and add it to the devices list"""
+        device_row = Gtk.ListBoxRow()
+        device_row.get_style_context().add_class("device-row")
+        
+        hbox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
+        
+        # Status indicator
+        status_icon = Gtk.Image()
+        hbox.pack_start(status_icon, False, False, 0)
+        
+        # Device name and type
+        label = Gtk.Label()
+        label.set_halign(Gtk.Align.START)
+        hbox.pack_start(label, True, True, 0)
+        
+        # Unpair button
+        unpair_button = Gtk.Button(label="Unpair")
+        unpair_button.connect("clicked", self.on_unpair_clicked, device_id)
+        hbox.pack_end(unpair_button, False, False, 0)
+        
+        device_row.add(hbox)
+        self.devices_list.add(device_row)
+        return device_row, status_icon, label
+    
+    def set_device_row_state(self, entry, device):
+        """Show a device's online state and name in its row"""
+        _, status_icon, label = entry
+        
+        if device.get("online", False):
+            status_icon.set_from_icon_name("user-available", Gtk.IconSize.MENU)
         else:
-            for device in devices:
-                device_row = Gtk.ListBoxRow()
-                device_row.get_style_context().add_class("device-row")
-                
-                hbox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
-                
-                # Status indicator
-                status_icon = Gtk.Image()
-                if device.get("online", False):
-                    status_icon.set_from_icon_name("user-available", Gtk.IconSize.MENU)
-                else:
-                    status_icon.set_from_icon_name("user-offline", Gtk.IconSize.MENU)
-                hbox.pack_start(status_icon, False, False, 0)
-                
-                # Device name and type
-                name = device.get("name", "Unknown")
-                device_type = device.get("type", "unknown")
-                label = Gtk.Label(label=f"{name} ({device_type})")
-                label.set_halign(Gtk.Align.START)
-                hbox.pack_start(label, True, True, 0)
-                
-                # Unpair button
-                unpair_button = Gtk.Button(label="Unpair")
-                unpair_button.connect("clicked", self.on_unpair_clicked, device.get("id"))
-                hbox.pack_end(unpair_button, False, False, 0)
-                
-                device_row.add(hbox)
-                self.devices_list.add(device_row)
-        
-        self.devices_list.show_all()
+            status_icon.set_from_icon_name("user-offline", Gtk.IconSize.MENU)
+        
+        name = device.get("name", "Unknown")
+        device_type = device.get("type", "unknown")
+        label.set_text(f"{name} ({device_type})")
     
     def update_transfers(self, transfers):
         """Update the transfers list"""
-        # Clear existing items
-        for child in self.transfers_box.get_children():
-            self.transfers_box.remove(child)
-        
-        # Add transfers or placeholder
+        # Nothing left: drop every card at once by swapping the container
         if not transfers:
-            placeholder = Gtk.Label(label="No active transfers")
-            placeholder.set_padding(10, 10)
-            self.transfers_box.pack_start(placeholder, False, False, 0)
-        else:
-            for transfer_id, transfer in transfers.items():
-                self.add_or_update_transfer(transfer)
+            self._pending_transfer_updates.clear()
+            self._transfer_state.clear()
+            self._transfers_dirty.clear()
+            self._clear_transfer_cards()
+            return
+        
+        # Forget transfers the server no longer reports, including ones that
+        # were only stored while the page was hidden
+        active_ids = {transfer.get("file_id") for transfer in transfers.values()}
+        for transfer_id in list(self._transfer_cards):
+            if transfer_id not in active_ids:
+                self._release_card(self._transfer_cards.pop(transfer_id))
+        for transfer_id in list(self._transfer_state):
+            if transfer_id not in active_ids:
+                del self._transfer_state[transfer_id]
+        for transfer_id in list(self._pending_transfer_updates):
+            if transfer_id not in active_ids:
+                del self._pending_transfer_updates[transfer_id]
+        self._transfers_dirty &= active_ids
+        
+        # Update existing cards in place and add cards for new transfers
+        for transfer in transfers.values():
+            self.add_or_update_transfer(transfer)
+        
+        # Show placeholder if nothing is left
+        if not self._transfer_cards:
+            self._clear_transfer_cards()
+    
+    def _clear_transfer_cards(self):
+        """Replace the cards box with the placeholder in one step"""
+        self._transfer_cards.clear()
+        if self._placeholder_shown:
+            return
         
-        self.transfers_box.show_all()
+        self.transfers_box.remove(self._cards_box)
+        self._cards_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
+        self.transfers_box.pack_start(self._no_transfers_placeholder, False, False, 0)
+        self._no_transfers_placeholder.show()
+        self._placeholder_shown = True
+    
+    def _show_transfer_cards(self):
+        """Swap the placeholder out for the cards box"""
+        if not self._placeholder_shown:
+            return
+        self.transfers_box.remove(self._no_transfers_placeholder)
+        self.transfers_box.pack_start(self._cards_box, True, True, 0)
+        self._cards_box.show()
+        self._placeholder_shown = False
     
     def update_transfer(self, transfer):
         """Update a single transfer"""
-        self.add_or_update_transfer(transfer)
-        self.transfers_box.show_all()
+        self.queue_transfer_update(transfer)
+    
+    def queue_transfer_update(self, transfer):
+        """Queue a transfer update so progress is redrawn at most every 100 ms"""
+        transfer_id = transfer.get("file_id")
+        
+        # Finished transfers are removed right away
+        if transfer.get("status", "") in _TERMINAL_TRANSFER_STATUSES:
+            self.add_or_update_transfer(transfer)
+            return
         
+        # Keep only the latest state per transfer until the next flush
+        self._pending_transfer_updates[transfer_id] = transfer
+        if not self._flush_source:
+            self._flush_source = GLib.timeout_add(100, self._flush_transfer_updates)
+    
+    def _flush_transfer_updates(self):
+        """Apply the latest queued state of every updated transfer"""
+        pending = self._pending_transfer_updates
+        self._pending_transfer_updates = {}
+        self._flush_source = 0
+        
+        for transfer in pending.values():
+            self.add_or_update_transfer(transfer)
+        return False
+    
     def add_or_update_transfer(self, transfer):
         """Add or update a transfer card"""
         transfer_id = transfer.get("file_id")
         
+        # A queued progress update must not bring a finished transfer back
+        if transfer.get("status", "") in _TERMINAL_TRANSFER_STATUSES:
+            self._pending_transfer_updates.pop(transfer_id, None)
+        
+        # Remember the latest state, but only touch widgets while the page is shown
+        self._transfer_state[transfer_id] = transfer
+        if self.transfers_box is None or not self.transfers_box.get_mapped():
+            self._transfers_dirty.add(transfer_id)
+            return
+        
+        self._transfers_dirty.discard(transfer_id)
+        self._apply_transfer_update(transfer)
+    
+    def _replay_transfer_updates(self, widget):
+        """Draw transfer updates that arrived while the page was hidden"""
+        dirty = self._transfers_dirty
+        self._transfers_dirty = set()
+        
+        for transfer_id in dirty:
+            transfer = self._transfer_state.get(transfer_id)
+            if transfer is not None:
+                self._apply_transfer_update(transfer)
+    
+    def _apply_transfer_update(self, transfer):
+        """Create, update or remove the card for a transfer"""
+        transfer_id = transfer.get("file_id")
+        
         # Look for existing transfer card
-        existing_card = None
-        for child in self.transfers_box.get_children():
-            if hasattr(child, 'transfer_id') and child.transfer_id == transfer_id:
-                existing_card = child
-                break
+        existing_card = self._transfer_cards.get(transfer_id)
         
         # If transfer is complete or failed and there's an existing card, remove it
+        # together with any other cards that finish before the next idle
         status = transfer.get("status", "")
-        if status in ["completed", "failed", "canceled"] and existing_card:
-            self.transfers_box.remove(existing_card)
-            
-            # Add "No active transfers" if this was the last one
-            if len(self.transfers_box.get_children()) == 0:
-                placeholder = Gtk.Label(label="No active transfers")
-                placeholder.set_padding(10, 10)
-                self.transfers_box.pack_start(placeholder, False, False, 0)
-                
+        if status in _TERMINAL_TRANSFER_STATUSES:
+            if existing_card:
+                self._pending_removals.add(transfer_id)
+                if not self._removal_source:
+                    self._removal_source = GLib.idle_add(self._flush_removals)
+            else:
+                # Finished before a card was ever drawn, e.g. while the page was hidden
+                self._transfer_state.pop(transfer_id, None)
             return
         
-        # If this is a new transfer, make sure there's no placeholder
-        if not existing_card:
-            # Remove "No active transfers" placeholder if it exists
-            for child in self.transfers_box.get_children():
-                if isinstance(child, Gtk.Label) and child.get_text() == "No active transfers":
-                    self.transfers_box.remove(child)
-                    break
-        
-        # Create or update transfer card
+        # Update an existing card in place
         if existing_card:
-            card = existing_card
-            # Update progress
-            progress_bar = None
-            for child in card.get_children()[0].get_children():
-                if isinstance(child, Gtk.ProgressBar):
-                    progress_bar = child
-                    break
-            
-            if progress_bar:
-                progress = transfer.get("progress", 0) / 100.0
-                progress_bar.set_fraction(progress)
-                
-                # Also update the info label
-                info_label = None
-                for child in card.get_children()[0].get_children():
-                    if isinstance(child, Gtk.Label) and hasattr(child, 'is_info_label'):
-                        info_label = child
-                        break
-                
-                if info_label:
-                    direction = transfer.get("direction", "transfer")
-                    bytes_transferred = transfer.get("bytes_transferred", 0)
-                    total_bytes = transfer.get("total_bytes", 0)
-                    
-                    direction_text = "Downloading from" if direction == "download" else "Uploading to"
-                    info_label.set_text(
-                        f"{direction_text} device\n"
-                        f"{bytes_transferred // 1024} KB / {total_bytes // 1024} KB"
-                    )
-        else:
-            # Create a new card
-            card = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
-            card.transfer_id = transfer_id
-            card.get_style_context().add_class("transfer-card")
-            
-            # File name header
-            file_name = transfer.get("file_name", "Unknown file")
-            header = Gtk.Label(label=file_name)
-            header.set_halign(Gtk.Align.START)
-            header.set_ellipsize(Pango.EllipsizeMode.MIDDLE)
-            header.get_style_context().add_class("card-header")
-            card.pack_start(header, False, False, 0)
-            
-            # Transfer info
-            direction = transfer.get("direction", "transfer")
-            bytes_transferred = transfer.get("bytes_transferred", 0)
-            total_bytes = transfer.get("total_bytes", 0)
-            
-            direction_text = "Downloading from" if direction == "download" else "Uploading to"
-            info = Gtk.Label()
-            info.is_info_label = True  # Custom attribute to find it later
-            info.set_text(
-                f"{direction_text} device\n"
-                f"{bytes_transferred // 1024} KB / {total_bytes // 1024} KB"
-            )
-            info.set_halign(Gtk.Align.START)
-            info.set_line_wrap(True)
-            card.pack_start(info, False, False, 0)
-            
-            # Progress bar
-            progress = transfer.get("progress", 0) / 100.0
-            progress_bar = Gtk.ProgressBar()
-            progress_bar.set_fraction(progress)
-            card.pack_start(progress_bar, False, False, 0)
-            
-            # Cancel button
-            cancel_button = Gtk.Button(label="Cancel")
-            cancel_button.connect("clicked", self.on_cancel_transfer_clicked, transfer_id)
-            cancel_button.set_halign(Gtk.Align.END)
-            card.pack_start(cancel_button, False, False, 0)
-            
-            # Add to transfers box
-            self.transfers_box.pack_start(card, False, False, 0)
+            existing_card.progress_bar.set_fraction(transfer.get("progress", 0) / 100.0)
+            self._set_card_info(existing_card, transfer)
+            return
+        
+        # Make sure the cards box is shown, then reuse a pooled card if possible
+        self._show_transfer_cards()
+        card = self._card_pool.pop() if self._card_pool else self._make_card()
+        card.transfer_id = transfer_id
+        card.total_kb = -1
+        card.last_shown_kb = -1
+        card.last_direction = None
+        card.header_label.set_text(transfer.get("file_name", "Unknown file"))
+        card.progress_bar.set_fraction(transfer.get("progress", 0) / 100.0)
+        self._set_card_info(card, transfer)
+        
+        # Add to cards box
+        self._transfer_cards[transfer_id] = card
+        self._cards_box.pack_start(card, False, False, 0)
+    
+    def _flush_removals(self):
+        """Remove the cards of all transfers that finished since the last flush"""
+        removals = self._pending_removals
+        self._pending_removals = set()
+        self._removal_source = 0
+        
+        self._cards_box.freeze_child_notify()
+        for transfer_id in removals:
+            self._transfer_state.pop(transfer_id, None)
+            card = self._transfer_cards.pop(transfer_id, None)
+            if card is not None:
+                self._release_card(card)
+        self._cards_box.thaw_child_notify()
+        
+        # Swap in "No active transfers" if those were the last ones
+        if not self._transfer_cards:
+            self._clear_transfer_cards()
+        return False
+    
+    def _set_card_info(self, card, transfer):
+        """Refresh the info label only when the shown KB values or direction change"""
+        new_kb = transfer.get("bytes_transferred", 0) // 1024
+        total_kb = transfer.get("total_bytes", 0) // 1024
+        direction = transfer.get("direction", "transfer")
+        if (new_kb == card.last_shown_kb and total_kb == card.total_kb
+                and direction == card.last_direction):
+            return
+        
+        if direction != card.last_direction:
+            card.direction_text = "Downloading from" if direction == "download" else "Uploading to"
+            card.last_direction = direction
+        
+        new_text = f"{card.direction_text} device\n{new_kb} KB / {total_kb} KB"
+        card.last_shown_kb = new_kb
+        card.total_kb = total_kb
+        
+        # A reused card may already show the same text
+        if card.info_label.get_text() != new_text:
+            card.info_label.set_label(new_text)
+    
+    def _make_card(self):
+        """Build an empty transfer card"""
+        # Cards are text-only; any icon added here must be loaded through _get_icon()
+        card = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
+        card.transfer_id = None
+        card.get_style_context().add_class("transfer-card")
+        
+        # File name header
+        header = Gtk.Label()
+        header.set_halign(Gtk.Align.START)
+        header.set_ellipsize(Pango.EllipsizeMode.MIDDLE)
+        card.pack_start(header, False, False, 0)
+        card.header_label = header
+        
+        # Transfer info
+        info = Gtk.Label()
+        info.set_use_markup(False)
+        info.set_single_line_mode(False)
+        info.set_halign(Gtk.Align.START)
+        info.set_line_wrap(True)
+        card.pack_start(info, False, False, 0)
+        card.info_label = info
+        
+        # Progress bar
+        progress_bar = Gtk.ProgressBar()
+        card.pack_start(progress_bar, False, False, 0)
+        card.progress_bar = progress_bar
+        
+        # Cancel button, which looks up the card's current transfer when clicked
+        cancel_button = Gtk.Button(label="Cancel")
+        cancel_button.connect("clicked", self._on_card_cancel_clicked)
+        cancel_button.set_halign(Gtk.Align.END)
+        card.pack_start(cancel_button, False, False, 0)
+        card.cancel_button = cancel_button
+        
+        # Show the new card's widgets once; pooled cards stay visible
+        card.show_all()
+        return card
+    
+    def _release_card(self, card):
+        """Detach a card and keep it for the next transfer if the pool has room"""
+        self._cards_box.remove(card)
+        card.transfer_id = None
+        if len(self._card_pool) < _CARD_POOL_SIZE:
+            self._card_pool.append(card)
     
     def on_refresh_clicked(self, button):
         """Handle refresh button click"""
@@ -1001,149 +1440,128 @@ class SICMainWindow(Gtk.ApplicationWindow):
     
     def on_send_file_clicked(self, button):
         """Handle send file button click"""
-        dialog = Gtk.FileChooserDialog(
-            title="Select a file to send",
-            parent=self,
-            action=Gtk.FileChooserAction.OPEN
-        )
-        dialog.add_button(Gtk.STOCK_CANCEL, Gtk.ResponseType.CANCEL)
-        dialog.add_button(Gtk.STOCK_OPEN, Gtk.ResponseType.OK)
+        # Build the file chooser once and reuse it on later clicks
+        if self._file_chooser is None:
+            self._file_chooser = Gtk.FileChooserDialog(
+                title="Select a file to send",
+                action=Gtk.FileChooserAction.OPEN
+            )
+            self._file_chooser.add_button(Gtk.STOCK_CANCEL, Gtk.ResponseType.CANCEL)
+            self._file_chooser.add_button(Gtk.STOCK_OPEN, Gtk.ResponseType.OK)
         
+        dialog = self._file_chooser
+        dialog.set_transient_for(self)
         response = dialog.run()
+        file_path = dialog.get_filename()
+        dialog.hide()
+        
         if response == Gtk.ResponseType.OK:
-            file_path = dialog.get_filename()
-            
             # Show device selection dialog if there are devices
             if self.app.paired_devices:
                 self.show_device_selection_dialog(file_path)
             else:
                 self.show_error_dialog("No paired devices", "Please pair a device first.")
-        
-        dialog.destroy()
     
     def show_device_selection_dialog(self, file_path):
         """Show a dialog to select which device to send the file to"""
-        dialog = Gtk.Dialog(
-            title="Select Device",
-            parent=self,
-            flags=0,
-            buttons=(
-                Gtk.STOCK_CANCEL, Gtk.ResponseType.CANCEL,
-                "Send", Gtk.ResponseType.OK
+        # Build the dialog once and only refill the device list afterwards
+        if self._device_dialog is None:
+            self._device_dialog = Gtk.Dialog(
+                title="Select Device",
+                flags=0,
+                buttons=(
+                    Gtk.STOCK_CANCEL, Gtk.ResponseType.CANCEL,
+                    "Send", Gtk.ResponseType.OK
+                )
             )
-        )
-        
-        content_area = dialog.get_content_area()
-        content_area.set_border_width(15)
-        
-        label = Gtk.Label(label="Select a device to send the file to:")
-        content_area.pack_start(label, False, False, 10)
-        
-        # Device list
-        device_combo = Gtk.ComboBoxText()
-        for device_id, device in self.app.paired_devices.items():
-            if device.get("online", False):
-                device_combo.append(device_id, device.get("name", "Unknown"))
+            
+            content_area = self._device_dialog.get_content_area()
+            content_area.set_border_width(15)
+            
+            label = Gtk.Label(label="Select a device to send the file to:")
+            content_area.pack_start(label, False, False, 10)
+            
+            # Device list, backed by a store that is refilled while detached
+            self._device_store = Gtk.ListStore(str, str)
+            self._device_combo = Gtk.ComboBox(model=self._device_store)
+            self._device_combo.set_id_column(0)
+            renderer = Gtk.CellRendererText()
+            self._device_combo.pack_start(renderer, True)
+            self._device_combo.add_attribute(renderer, "text", 1)
+            content_area.pack_start(self._device_combo, False, False, 5)
+            content_area.show_all()
+        
+        dialog = self._device_dialog
+        device_combo = self._device_combo
+        
+        # Refill the device list with the combo detached so it sees one change
+        store = self._device_store
+        device_combo.set_model(None)
+        store.clear()
+        for device_id, name in self.app.get_online_devices():
+            store.insert_with_valuesv(-1, [0, 1], [device_id, name])
+        device_combo.set_model(store)
         
         # Select first device
         device_combo.set_active(0)
-        content_area.pack_start(device_combo, False, False, 5)
         
-        dialog.show_all()
+        dialog.set_transient_for(self)
         response = dialog.run()
+        selected_device = device_combo.get_active_id()
+        dialog.hide()
         
         if response == Gtk.ResponseType.OK:
-            selected_device = device_combo.get_active_id()
             if selected_device:
                 # Send file to selected device
                 self.send_file_to_device(file_path, selected_device)
             else:
                 self.show_error_dialog("Error", "No device selected.")
-        
-        dialog.destroy()
     
     def send_file_to_device(self, file_path, device_id):
         """Send a file to the selected device"""
         # This is a stub - in a real implementation, this would call
         # into the server backend to initiate a file transfer
-        self.app.send_message({
-            "type": "admin_request",
-            "action": "send_file",
-            "file_path": file_path,
-            "device_id": device_id
-        })
+        self.app.send_admin_request("send_file", file_path=file_path, device_id=device_id)
         
         self.update_status(f"Sending file to device...", "info")
     
     def on_unpair_clicked(self, button, device_id):
         """Handle unpair button click"""
-        dialog = Gtk.MessageDialog(
-            transient_for=self,
-            flags=0,
-            message_type=Gtk.MessageType.QUESTION,
-            buttons=Gtk.ButtonsType.YES_NO,
-            text="Unpair Device"
-        )
-        dialog.format_secondary_text("Are you sure you want to unpair this device?")
+        # Build the confirmation once and reuse it
+        if self._unpair_dialog is None:
+            self._unpair_dialog = Gtk.MessageDialog(
+                flags=0,
+                message_type=Gtk.MessageType.QUESTION,
+                buttons=Gtk.ButtonsType.YES_NO,
+                text="Unpair Device"
+            )
         
+        dialog = self._unpair_dialog
+        dialog.format_secondary_text("Are you sure you want to unpair this device?")
+        dialog.set_transient_for(self)
         response = dialog.run()
+        dialog.hide()
+        
         if response == Gtk.ResponseType.YES:
             # Send unpair request to server
-            self.app.send_message({
-                "type": "admin_request",
-                "action": "unpair_device",
-                "device_id": device_id
-            })
-        
-        dialog.destroy()
+            self.app.send_admin_request("unpair_device", device_id=device_id)
+    
+    def _on_card_cancel_clicked(self, button):
+        """Cancel the transfer currently shown on the button's card"""
+        self.on_cancel_transfer_clicked(button, button.get_parent().transfer_id)
     
     def on_cancel_transfer_clicked(self, button, transfer_id):
         """Handle cancel transfer button click"""
         # Send cancel request to server
-        self.app.send_message({
-            "type": "admin_request",
-            "action": "cancel_transfer",
-            "transfer_id": transfer_id
-        })
-    
-    def on_clipboard_switch_toggled(self, switch, gparam):
-        """Handle clipboard sync setting toggle"""
-        active = switch.get_active()
-        self.app.settings["clipboard_sync"] = active
-        
-        # Send setting to server
-        self.app.send_message({
-            "type": "admin_request",
-            "action": "set_setting",
-            "setting": "clipboard_sync",
-            "value": active
-        })
-    
-    def on_notification_switch_toggled(self, switch, gparam):
-        """Handle notification mirroring setting toggle"""
-        active = switch.get_active()
-        self.app.settings["notification_mirroring"] = active
-        
-        # Send setting to server
-        self.app.send_message({
-            "type": "admin_request",
-            "action": "set_setting",
-            "setting": "notification_mirroring",
-            "value": active
-        })
-    
-    def on_reconnect_switch_toggled(self, switch, gparam):
-        """Handle auto reconnect setting toggle"""
+        self.app.send_admin_request("cancel_transfer", transfer_id=transfer_id)
+    
+    def _on_setting_switch_toggled(self, switch, gparam, setting_key):
+        """Handle a settings switch toggle"""
         active = switch.get_active()
-        self.app.settings["auto_reconnect"] = active
+        setattr(self.app, setting_key, active)
         
         # Send setting to server
-        self.app.send_message({
-            "type": "admin_request",
-            "action": "set_setting",
-            "setting": "auto_reconnect",
-            "value": active
-        })
+        self.app.send_admin_request("set_setting", setting=setting_key, value=active)
     
     def show_error_dialog(self, title, message):
         """Show an error dialog"""